@@ -1,11 +1,46 @@
+import calendar
+import math
 import os
 import sqlite3
+from contextlib import closing
+from datetime import date
+import numpy as np
 import pandas as pd
-import matplotlib.pyplot as plt
+import altair as alt
 import streamlit as st
 
 # CONFIG 
 DB_PATH = "business.db"
+PAGE_SIZE = 1000  # rows per page in the raw data tables
+# Table definitions; `date` columns hold unix seconds (midnight UTC) and
+# `amount` columns hold whole cents
+TABLE_SCHEMAS = {
+    "expenses": """
+        CREATE TABLE IF NOT EXISTS expenses (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            date INTEGER NOT NULL,
+            category TEXT,
+            description TEXT,
+            amount INTEGER NOT NULL
+        )
+    """,
+    # income table supports category as well
+    "income": """
+        CREATE TABLE IF NOT EXISTS income (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            date INTEGER NOT NULL,
+            source TEXT,
+            category TEXT,
+            description TEXT,
+            amount INTEGER NOT NULL
+        )
+    """,
+}
+# Data columns of each table (everything but `id`), as seeded and displayed
+TABLE_COLUMNS = {
+    "expenses": ["date", "category", "description", "amount"],
+    "income": ["date", "source", "category", "description", "amount"],
+}
 st.set_page_config(
     page_title="Business Expense Analyzer",
     layout="wide",
@@ -18,9 +53,44 @@ st.caption(
 )
 
 # DB Helpers
+@st.cache_resource
 def get_connection():
-    """Create a connection to the SQLite database."""
-    return sqlite3.connect(DB_PATH)
+    """
+    Open one long-lived connection to the SQLite database.
+    Cached across reruns so the page cache stays warm.
+    """
+    conn = sqlite3.connect(DB_PATH, check_same_thread=False, isolation_level=None)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    return conn
+def to_epoch(d: date) -> int:
+    """Convert a date to unix seconds, the format stored in `date` columns."""
+    return calendar.timegm(d.timetuple())
+def to_cents(amount: float) -> int:
+    """
+    Convert a dollar amount to whole cents, the format stored in `amount`.
+    Halves round away from zero, the same as `amounts_to_cents`, so every
+    write path stores the same value.
+    """
+    cents = amount * 100
+    return int(cents + math.copysign(0.5, cents))
+def amounts_to_cents(amounts: pd.Series) -> pd.Series:
+    """Vectorized `to_cents` for a column of dollar amounts."""
+    cents = amounts * 100
+    return (cents + np.copysign(0.5, cents)).astype("int64")
+def dates_to_epoch(dates: pd.Series, source: str) -> pd.Series:
+    """
+    Parse a column of date strings (any format pandas recognizes) to unix
+    seconds. Raises ValueError naming the entries of `source`, by index,
+    that can't be parsed.
+    """
+    parsed = pd.to_datetime(dates, format="mixed", errors="coerce")
+    bad = dates[parsed.isna()]
+    if not bad.empty:
+        listed = ", ".join(f"{i} ({v!r})" for i, v in bad.head(5).items())
+        raise ValueError(f"Unrecognized dates in {source}: {listed}")
+    return parsed.dt.as_unit("s").astype("int64")
 def ensure_columns(df: pd.DataFrame, columns: list) -> pd.DataFrame:
     """
     Make sure the DataFrame has all columns in `columns`.
@@ -31,123 +101,269 @@ def ensure_columns(df: pd.DataFrame, columns: list) -> pd.DataFrame:
         if col not in df.columns:
             df[col] = None
     return df[columns]
+def seed_table(conn, table_name: str, csv_path: str, columns: list) -> None:
+    """
+    Bulk insert a CSV file into `table_name` inside a single transaction.
+    The CSV is read in 10k-row chunks so large files stay out of memory.
+    """
+    sql = (
+        f"INSERT INTO {table_name} ({', '.join(columns)}) "
+        f"VALUES ({', '.join('?' for _ in columns)})"
+    )
+    conn.execute("PRAGMA synchronous=OFF")
+    try:
+        conn.execute("BEGIN")
+        # commits on success, rolls back if any chunk fails
+        with conn:
+            for chunk in pd.read_csv(csv_path, chunksize=10_000):
+                chunk = ensure_columns(chunk, columns)
+                chunk["date"] = dates_to_epoch(chunk["date"], f"{csv_path} (data row)")
+                chunk["amount"] = amounts_to_cents(chunk["amount"])
+                chunk = chunk.astype(object).where(chunk.notna(), None)
+                conn.executemany(sql, chunk.itertuples(index=False, name=None))
+    finally:
+        conn.execute("PRAGMA synchronous=NORMAL")
+def migrate_table(conn, table_name: str) -> None:
+    """
+    Rebuild a table created by an older version of the app (TEXT dates,
+    REAL amounts) so it matches TABLE_SCHEMAS. Does nothing otherwise.
+    Old values are converted with the same helpers the CSV seed uses.
+    """
+    table_info = conn.execute(f"PRAGMA table_info({table_name})").fetchall()
+    columns = [col[1] for col in table_info]
+    types = {col[1]: col[2].upper() for col in table_info}
+    text_dates = types["date"] == "TEXT"
+    real_amounts = types["amount"] == "REAL"
+    if not (text_dates or real_amounts):
+        return
+    sql = (
+        f"INSERT INTO {table_name} ({', '.join(columns)}) "
+        f"VALUES ({', '.join('?' for _ in columns)})"
+    )
+    conn.execute("BEGIN")
+    # commits on success, rolls back (undoing the rename) if any step fails
+    with conn:
+        conn.execute(f"ALTER TABLE {table_name} RENAME TO {table_name}_old")
+        conn.execute(TABLE_SCHEMAS[table_name])
+        for chunk in pd.read_sql_query(
+            f"SELECT {', '.join(columns)} FROM {table_name}_old",
+            conn,
+            chunksize=10_000,
+        ):
+            chunk = chunk.set_index("id", drop=False)
+            if text_dates:
+                chunk["date"] = dates_to_epoch(chunk["date"], f"{table_name} (id)")
+            if real_amounts:
+                chunk["amount"] = amounts_to_cents(chunk["amount"])
+            chunk = chunk.astype(object).where(chunk.notna(), None)
+            conn.executemany(sql, chunk.itertuples(index=False, name=None))
+        conn.execute(f"DROP TABLE {table_name}_old")
+@st.cache_resource
 def init_db():
     """
     Create the database and tables if they don't exist.
     If tables are empty, seed them from the CSV files in /data.
+    Cached so this runs once per server process, not on every rerun.
     """
     conn = get_connection()
     cur = conn.cursor()
     
-    # Create tables 
-    cur.execute(
-        """
-        CREATE TABLE IF NOT EXISTS expenses (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            date TEXT NOT NULL,
-            category TEXT,
-            description TEXT,
-            amount REAL NOT NULL
-        )
-        """
-    )
+    # Create tables, converting older column types if needed
+    for table_name, schema in TABLE_SCHEMAS.items():
+        cur.execute(schema)
+        migrate_table(conn, table_name)
     
-    # income table supports category as well
-    cur.execute(
-        """
-        CREATE TABLE IF NOT EXISTS income (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            date TEXT NOT NULL,
-            source TEXT,
-            category TEXT,
-            description TEXT,
-            amount REAL NOT NULL
-        )
-        """
-    )
+    # Index the date column so range filters don't scan the whole table
+    cur.execute("CREATE INDEX IF NOT EXISTS idx_expenses_date ON expenses(date)")
+    cur.execute("CREATE INDEX IF NOT EXISTS idx_income_date ON income(date)")
     
-    #  Check if tables have data 
-    cur.execute("SELECT COUNT(*) FROM expenses")
-    expenses_count = cur.fetchone()[0]
-    cur.execute("SELECT COUNT(*) FROM income")
-    income_count = cur.fetchone()[0]
+    #  Check if tables have data (first row only, no full count)
+    expenses_empty = cur.execute("SELECT 1 FROM expenses LIMIT 1").fetchone() is None
+    income_empty = cur.execute("SELECT 1 FROM income LIMIT 1").fetchone() is None
     
     # Seed expenses from CSV if empty 
-    if expenses_count == 0 and os.path.exists("data/expenses.csv"):
-        exp_df = pd.read_csv("data/expenses.csv")
-        exp_df = ensure_columns(
-            exp_df, ["date", "category", "description", "amount"]
-        )
-        exp_df.to_sql("expenses", conn, if_exists="append", index=False)
+    if expenses_empty and os.path.exists("data/expenses.csv"):
+        seed_table(conn, "expenses", "data/expenses.csv", TABLE_COLUMNS["expenses"])
     
     # Seed income from CSV if empty 
-    if income_count == 0 and os.path.exists("data/income.csv"):
-        inc_df = pd.read_csv("data/income.csv")
-        inc_df = ensure_columns(
-            inc_df, ["date", "source", "category", "description", "amount"]
-        )
-        inc_df.to_sql("income", conn, if_exists="append", index=False)
-    conn.commit()
-    conn.close()
+    if income_empty and os.path.exists("data/income.csv"):
+        seed_table(conn, "income", "data/income.csv", TABLE_COLUMNS["income"])
 @st.cache_data
-def load_table(table_name: str) -> pd.DataFrame:
-    """Load a table from SQLite into a pandas DataFrame."""
+def get_date_bounds():
+    """
+    Return the earliest and latest dates across both tables (or None, None).
+    MIN/MAX are answered from the date indexes; the result is cached.
+    """
     conn = get_connection()
-    df = pd.read_sql_query(f"SELECT * FROM {table_name}", conn)
-    conn.close()
-    if "date" in df.columns:
-        df["date"] = pd.to_datetime(df["date"])
-    return df
+    dates = []
+    for table_name in ("expenses", "income"):
+        dates.extend(
+            d for d in conn.execute(
+                f"SELECT MIN(date), MAX(date) FROM {table_name}"
+            ).fetchone()
+            if d is not None
+        )
+    if not dates:
+        return None, None
+    return (
+        pd.to_datetime(min(dates), unit="s").date(),
+        pd.to_datetime(max(dates), unit="s").date(),
+    )
+@st.cache_data
+def load_page(table_name: str, start, end, page: int) -> pd.DataFrame:
+    """
+    Load one page (PAGE_SIZE rows, 0-based) of a table between `start` and
+    `end`, ready for display: only the data columns (no `id`), amounts in
+    dollars, and categorical text columns, which Arrow sends
+    dictionary-encoded. Done here so cached pages need no per-rerun copies.
+    """
+    columns = [
+        "amount / 100.0 AS amount" if col == "amount" else col
+        for col in TABLE_COLUMNS[table_name]
+    ]
+    df = pd.read_sql_query(
+        f"SELECT {', '.join(columns)} FROM {table_name} "
+        "WHERE date BETWEEN ? AND ? "
+        "ORDER BY date, id LIMIT ? OFFSET ?",
+        get_connection(),
+        params=(to_epoch(start), to_epoch(end), PAGE_SIZE, page * PAGE_SIZE),
+        parse_dates={"date": {"unit": "s"}},
+    )
+    return df.astype(
+        {col: "category" for col in ("category", "source") if col in df.columns}
+    )
+@st.cache_data
+def load_record_labels(table_name: str, start, end, page: int) -> dict:
+    """
+    Map id -> selectbox label for one page (PAGE_SIZE rows, 0-based) of the
+    records of a table between `start` and `end`.
+    """
+    label_column, fallback = {
+        "expenses": ("category", "Uncategorized"),
+        "income": ("source", "Unknown Source"),
+    }[table_name]
+    df = pd.read_sql_query(
+        f"SELECT id, date, {label_column}, amount FROM {table_name} "
+        "WHERE date BETWEEN ? AND ? ORDER BY date, id LIMIT ? OFFSET ?",
+        get_connection(),
+        params=(to_epoch(start), to_epoch(end), PAGE_SIZE, page * PAGE_SIZE),
+        parse_dates={"date": {"unit": "s"}},
+    )
+    labels = (
+        df["id"].astype(str)
+        + " | " + df["date"].dt.strftime("%Y-%m-%d")
+        + " | " + df[label_column].fillna(fallback).replace("", fallback)
+        + " | " + (df["amount"] / 100).map("${:,.2f}".format)
+    )
+    return dict(zip(df["id"].to_numpy(), labels.to_numpy()))
+def load_record(table_name: str, record_id: int) -> pd.Series:
+    """Load a single record by primary key (amount in cents)."""
+    return pd.read_sql_query(
+        f"SELECT * FROM {table_name} WHERE id=?",
+        get_connection(),
+        params=(int(record_id),),
+        parse_dates={"date": {"unit": "s"}},
+    ).iloc[0]
+@st.cache_data
+def count_rows(table_name: str, start, end) -> int:
+    """Count the rows of a table dated between `start` and `end`."""
+    return get_connection().execute(
+        f"SELECT COUNT(*) FROM {table_name} WHERE date BETWEEN ? AND ?",
+        (to_epoch(start), to_epoch(end)),
+    ).fetchone()[0]
+@st.cache_data(ttl=300)
+def load_dashboard(start, end):
+    """
+    Load everything the dashboard panels show for `start`..`end` in one
+    read transaction: (total income, total expenses, expense totals per
+    category, daily income totals).
+    Uses its own short-lived connection so the transaction can't collide
+    with other sessions sharing the cached `get_connection()` handle.
+    """
+    params = (to_epoch(start), to_epoch(end))
+    with closing(sqlite3.connect(DB_PATH, isolation_level=None)) as conn, conn:
+        conn.execute("BEGIN DEFERRED")
+        total_income, total_expenses = conn.execute(
+            """
+            SELECT
+                (SELECT COALESCE(SUM(amount), 0) FROM income WHERE date BETWEEN ?1 AND ?2),
+                (SELECT COALESCE(SUM(amount), 0) FROM expenses WHERE date BETWEEN ?1 AND ?2)
+            """,
+            params,
+        ).fetchone()
+        category_totals = pd.read_sql_query(
+            """
+            SELECT COALESCE(category, 'Uncategorized') AS category, SUM(amount) AS total
+            FROM expenses
+            WHERE date BETWEEN ? AND ?
+            GROUP BY 1
+            """,
+            conn,
+            params=params,
+        ).set_index("category")["total"]
+        income_time = pd.read_sql_query(
+            """
+            SELECT date, SUM(amount) AS amount
+            FROM income
+            WHERE date BETWEEN ? AND ?
+            GROUP BY date
+            ORDER BY date
+            """,
+            conn,
+            params=params,
+            parse_dates={"date": {"unit": "s"}},
+        ).set_index("date")["amount"]
+    # one point per day on the chart, days without income as 0
+    income_time = income_time.resample("D").sum()
+    # sums are exact in cents; convert to dollars only for display
+    return (
+        total_income / 100,
+        total_expenses / 100,
+        category_totals / 100,
+        income_time / 100,
+    )
+def page_picker(row_count: int, key: str) -> int:
+    """
+    Show a page number input when `row_count` spans more than one page.
+    Return the selected page, 0-based.
+    """
+    if row_count <= PAGE_SIZE:
+        return 0
+    page = st.number_input(
+        "Page", min_value=1, max_value=math.ceil(row_count / PAGE_SIZE), key=key
+    )
+    return page - 1
 def refresh_data():
     """Clear cache and reload tables."""
-    load_table.clear()  # clears streamlit cache for this function
+    get_date_bounds.clear()  # clears streamlit cache for this function
+    load_page.clear()
+    load_record_labels.clear()
+    count_rows.clear()
+    load_dashboard.clear()
 #  Initialize & Load
-init_db()
-expenses = load_table("expenses")
-income = load_table("income")
-if expenses.empty and income.empty:
+try:
+    init_db()
+except ValueError as e:
+    st.error(f"Could not set up the database: {e}")
+    st.stop()
+min_date, max_date = get_date_bounds()
+if min_date is None:
     st.error(
         "No data available. Check your SQLite database or the CSV files "
         "in the /data folder."
     )
     st.stop()
-# drop id column for display tables (not for internal use)
-if "id" in expenses.columns:
-    expenses_display = expenses.drop(columns=["id"])
-else:
-    expenses_display = expenses.copy()
-if "id" in income.columns:
-    income_display = income.drop(columns=["id"])
-else:
-    income_display = income.copy()
 
 #  Sidebar Filters
 st.sidebar.header("Filters")
-dates = []
-if not expenses.empty:
-    dates.append(expenses["date"].min())
-    dates.append(expenses["date"].max())
-if not income.empty:
-    dates.append(income["date"].min())
-    dates.append(income["date"].max())
-min_date = min(dates)
-max_date = max(dates)
 start_date = st.sidebar.date_input("Start Date", min_date)
 end_date = st.sidebar.date_input("End Date", max_date)
 if start_date > end_date:
     st.sidebar.error("Start date must be before end date.")
-# filter by date
-expenses_filtered = expenses[
-    (expenses["date"] >= pd.to_datetime(start_date))
-    & (expenses["date"] <= pd.to_datetime(end_date))
-]
-income_filtered = income[
-    (income["date"] >= pd.to_datetime(start_date))
-    & (income["date"] <= pd.to_datetime(end_date))
-]
 #  Metrics
-total_expenses = float(expenses_filtered["amount"].sum()) if not expenses_filtered.empty else 0.0
-total_income = float(income_filtered["amount"].sum()) if not income_filtered.empty else 0.0
+total_income, total_expenses, category_totals, income_time = load_dashboard(
+    start_date, end_date
+)
 profit = total_income - total_expenses
 col1, col2, col3 = st.columns(3)
 col1.metric("Total Income", f"${total_income:,.2f}")
@@ -155,27 +371,26 @@ col2.metric("Total Expenses", f"${total_expenses:,.2f}")
 col3.metric("Profit", f"${profit:,.2f}", delta=f"{profit:,.2f}")
 st.markdown("---")
 # Expense Breakdown
-if (
-    not expenses_filtered.empty
-    and "category" in expenses_filtered.columns
-):
+if not category_totals.empty:
     st.subheader("💸 Expense Breakdown by Category")
-    category_totals = expenses_filtered.groupby("category")["amount"].sum()
     left, right = st.columns([1, 1.2])
     with left:
         st.dataframe(category_totals.rename("Total Amount"))
     with right:
-        fig, ax = plt.subplots()
-        ax.pie(category_totals, labels=category_totals.index, autopct="%1.1f%%")
-        ax.set_title("Expenses by Category")
-        st.pyplot(fig)
+        pie = alt.Chart(
+            category_totals.reset_index(), title="Expenses by Category"
+        ).mark_arc().encode(
+            theta="total",
+            color="category",
+            tooltip=["category", alt.Tooltip("total", format="$,.2f")],
+        )
+        st.altair_chart(pie)
 else:
     st.info("No categorized expenses available for the selected date range.")
 st.markdown("---")
 #  Income Over Time
-if not income_filtered.empty and "date" in income_filtered.columns:
+if not income_time.empty:
     st.subheader("📈 Income Over Time")
-    income_time = income_filtered.set_index("date")["amount"].sort_index()
     st.line_chart(income_time)
 else:
     st.info("No income records available for the selected date range.")
@@ -185,18 +400,27 @@ st.subheader("📂 Raw Data (from SQLite database)")
 tab1, tab2 = st.tabs(["Expenses", "Income"])
 with tab1:
     st.write("Filtered Expenses Data")
-    df_exp = expenses_filtered.drop(columns=["id"]) if "id" in expenses_filtered.columns else expenses_filtered
-    st.dataframe(df_exp)
+    expenses_page = page_picker(
+        count_rows("expenses", start_date, end_date), key="expenses_page"
+    )
+    expenses_rows = load_page("expenses", start_date, end_date, expenses_page)
+    st.dataframe(expenses_rows)
 with tab2:
     st.write("Filtered Income Data")
-    df_inc = income_filtered.drop(columns=["id"]) if "id" in income_filtered.columns else income_filtered
-    st.dataframe(df_inc)
+    income_page = page_picker(
+        count_rows("income", start_date, end_date), key="income_page"
+    )
+    income_rows = load_page("income", start_date, end_date, income_page)
+    st.dataframe(income_rows)
 st.markdown("---")
 #  Manage Data (CRUD) 
-st.subheader("🛠 Manage Data")
-manage_tab_exp, manage_tab_inc = st.tabs(["Manage Expenses", "Manage Income"])
 #  Manage Expenses 
-with manage_tab_exp:
+@st.fragment
+def manage_expenses(start, end):
+    """
+    Add, edit and delete expenses dated between `start` and `end`.
+    Runs as a fragment so selecting a record only reruns this section.
+    """
     st.markdown("### ➕ Add New Expense")
     with st.form("add_expense_form"):
         exp_date = st.date_input("Date")
@@ -206,60 +430,59 @@ with manage_tab_exp:
         submitted = st.form_submit_button("Add Expense")
         if submitted:
             conn = get_connection()
-            conn.execute(
-                "INSERT INTO expenses (date, category, description, amount) VALUES (?, ?, ?, ?)",
-                (str(exp_date), exp_category or None, exp_desc or None, float(exp_amount)),
-            )
-            conn.commit()
-            conn.close()
+            with conn:
+                conn.execute(
+                    "INSERT INTO expenses (date, category, description, amount) VALUES (?, ?, ?, ?)",
+                    (to_epoch(exp_date), exp_category or None, exp_desc or None, to_cents(exp_amount)),
+                )
             refresh_data()
             st.success("Expense added successfully.")
             st.rerun()
     st.markdown("### ✏️ Edit or 🗑 Delete Expense")
-    if not expenses.empty and "id" in expenses.columns:
-        # Build label map for the selectbox
-        label_map = {}
-        for _, row in expenses.iterrows():
-            date_str = row["date"].date().isoformat() if isinstance(row["date"], pd.Timestamp) else str(row["date"])
-            category_str = row.get("category") or "Uncategorized"
-            amount_val = float(row["amount"])
-            label_map[row["id"]] = f"{row['id']} | {date_str} | {category_str} | ${amount_val:,.2f}"
+    expenses_count = count_rows("expenses", start, end)
+    if expenses_count:
+        # Label map for the selectbox, one page of records at a time
+        page = page_picker(expenses_count, key="manage_expenses_page")
+        label_map = load_record_labels("expenses", start, end, page)
         selected_expense_id = st.selectbox(
             "Select an expense to edit or delete",
             options=list(label_map.keys()),
-            format_func=lambda x: label_map.get(x, str(x))
+            format_func=label_map.__getitem__
         )
-        selected_row = expenses[expenses["id"] == selected_expense_id].iloc[0]
+        selected_row = load_record("expenses", selected_expense_id)
         with st.form("edit_expense_form"):
-            current_date = selected_row["date"].date() if isinstance(selected_row["date"], pd.Timestamp) else selected_row["date"]
+            current_date = selected_row["date"].date()
             new_date = st.date_input("Edit Date", value=current_date)
             new_category = st.text_input("Edit Category", value=selected_row.get("category") or "")
             new_desc = st.text_input("Edit Description", value=selected_row.get("description") or "")
-            new_amount = st.number_input("Edit Amount", min_value=0.0, value=float(selected_row["amount"]), step=1.0)
+            new_amount = st.number_input("Edit Amount", min_value=0.0, value=selected_row["amount"] / 100, step=1.0)
             save_changes = st.form_submit_button("Save Changes")
             if save_changes:
                 conn = get_connection()
-                conn.execute(
-                    "UPDATE expenses SET date=?, category=?, description=?, amount=? WHERE id=?",
-                    (str(new_date), new_category or None, new_desc or None, float(new_amount), int(selected_expense_id))
-                )
-                conn.commit()
-                conn.close()
+                with conn:
+                    conn.execute(
+                        "UPDATE expenses SET date=?, category=?, description=?, amount=? WHERE id=?",
+                        (to_epoch(new_date), new_category or None, new_desc or None, to_cents(new_amount), int(selected_expense_id))
+                    )
                 refresh_data()
                 st.success("Expense updated successfully.")
                 st.rerun()
         if st.button("🗑 Delete Selected Expense"):
             conn = get_connection()
-            conn.execute("DELETE FROM expenses WHERE id=?", (int(selected_expense_id),))
-            conn.commit()
-            conn.close()
+            with conn:
+                conn.execute("DELETE FROM expenses WHERE id=?", (int(selected_expense_id),))
             refresh_data()
             st.warning("Expense deleted.")
             st.rerun()
     else:
         st.info("No expenses available to manage.")
 #  Manage Income
-with manage_tab_inc:
+@st.fragment
+def manage_income(start, end):
+    """
+    Add, edit and delete income records dated between `start` and `end`.
+    Runs as a fragment so selecting a record only reruns this section.
+    """
     st.markdown("### ➕ Add New Income")
     with st.form("add_income_form"):
         inc_date = st.date_input("Date", key="income_date")
@@ -270,33 +493,29 @@ with manage_tab_inc:
         submitted_inc = st.form_submit_button("Add Income")
         if submitted_inc:
             conn = get_connection()
-            conn.execute(
-                "INSERT INTO income (date, source, category, description, amount) VALUES (?, ?, ?, ?, ?)",
-                (str(inc_date), inc_source or None, inc_category or None, inc_desc or None, float(inc_amount)),
-            )
-            conn.commit()
-            conn.close()
+            with conn:
+                conn.execute(
+                    "INSERT INTO income (date, source, category, description, amount) VALUES (?, ?, ?, ?, ?)",
+                    (to_epoch(inc_date), inc_source or None, inc_category or None, inc_desc or None, to_cents(inc_amount)),
+                )
             refresh_data()
             st.success("Income record added successfully.")
             st.rerun()
     st.markdown("### ✏️ Edit or 🗑 Delete Income")
-    if not income.empty and "id" in income.columns:
-        # Build label map for income selectbox
-        income_label_map = {}
-        for _, row in income.iterrows():
-            date_str = row["date"].date().isoformat() if isinstance(row["date"], pd.Timestamp) else str(row["date"])
-            source_str = row.get("source") or "Unknown Source"
-            amount_val = float(row["amount"])
-            income_label_map[row["id"]] = f"{row['id']} | {date_str} | {source_str} | ${amount_val:,.2f}"
+    income_count = count_rows("income", start, end)
+    if income_count:
+        # Label map for income selectbox, one page of records at a time
+        page = page_picker(income_count, key="manage_income_page")
+        income_label_map = load_record_labels("income", start, end, page)
         selected_income_id = st.selectbox(
             "Select an income record to edit or delete",
             options=list(income_label_map.keys()),
-            format_func=lambda x: income_label_map.get(x, str(x)),
+            format_func=income_label_map.__getitem__,
             key="income_select"
         )
-        selected_income_row = income[income["id"] == selected_income_id].iloc[0]
+        selected_income_row = load_record("income", selected_income_id)
         with st.form("edit_income_form"):
-            current_date_inc = selected_income_row["date"].date() if isinstance(selected_income_row["date"], pd.Timestamp) else selected_income_row["date"]
+            current_date_inc = selected_income_row["date"].date()
             new_inc_date = st.date_input("Edit Date", value=current_date_inc, key="edit_income_date")
             new_source = st.text_input("Edit Source", value=selected_income_row.get("source") or "")
             new_inc_category = st.text_input("Edit Category", value=selected_income_row.get("category") or "")
@@ -304,30 +523,33 @@ with manage_tab_inc:
             new_inc_amount = st.number_input(
                 "Edit Amount",
                 min_value=0.0,
-                value=float(selected_income_row["amount"]),
+                value=selected_income_row["amount"] / 100,
                 step=1.0,
                 key="edit_income_amount"
             )
             save_income_changes = st.form_submit_button("Save Changes")
             if save_income_changes:
                 conn = get_connection()
-                conn.execute(
-                    "UPDATE income SET date=?, source=?, category=?, description=?, amount=? WHERE id=?",
-                    (str(new_inc_date), new_source or None, new_inc_category or None, new_inc_desc or None, float(new_inc_amount), int(selected_income_id))
-                )
-                conn.commit()
-                conn.close()
+                with conn:
+                    conn.execute(
+                        "UPDATE income SET date=?, source=?, category=?, description=?, amount=? WHERE id=?",
+                        (to_epoch(new_inc_date), new_source or None, new_inc_category or None, new_inc_desc or None, to_cents(new_inc_amount), int(selected_income_id))
+                    )
                 refresh_data()
                 st.success("Income record updated successfully.")
                 st.rerun()
         if st.button("🗑 Delete Selected Income"):
             conn = get_connection()
-            conn.execute("DELETE FROM income WHERE id=?", (int(selected_income_id),))
-            conn.commit()
-            conn.close()
+            with conn:
+                conn.execute("DELETE FROM income WHERE id=?", (int(selected_income_id),))
             refresh_data()
             st.warning("Income record deleted.")
             st.rerun()
     else:
         st.info("No income records available to manage.")
-
+st.subheader("🛠 Manage Data")
+manage_tab_exp, manage_tab_inc = st.tabs(["Manage Expenses", "Manage Income"])
+with manage_tab_exp:
+    manage_expenses(start_date, end_date)
+with manage_tab_inc:
+    manage_income(start_date, end_date)